@@ -2,11 +2,33 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable, Iterable, Sequence
-from functools import wraps
-from typing import Protocol, cast
+from collections import OrderedDict
+from collections.abc import Callable, Hashable, Iterable
+from functools import cache
+from threading import Lock
+from types import FunctionType
+from typing import cast
+from weakref import WeakValueDictionary
 
-from .plugins import render_string_fallback
+
+@cache
+def _streamlit_control_flow_types() -> tuple[type[BaseException], ...]:
+    """Return Streamlit's control-flow exception types, resolved once per process.
+
+    Import failures propagate instead of returning a fallback value; functools.cache
+    does not memoize exceptions, so a failed lookup is retried on the next call.
+
+    Returns:
+        RerunException and StopException.
+
+    """
+    # v1.3x+ stable import path
+    from streamlit.runtime.scriptrunner_utils.exceptions import (  # noqa: PLC0415
+        RerunException,
+        StopException,
+    )
+
+    return (RerunException, StopException)
 
 
 def _is_streamlit_control_flow(exc: BaseException) -> bool:
@@ -23,51 +45,142 @@ def _is_streamlit_control_flow(exc: BaseException) -> bool:
 
     """
     try:
-        # v1.3x+ stable import path
-        from streamlit.runtime.scriptrunner_utils.exceptions import (  # noqa: PLC0415
-            RerunException,
-            StopException,
-        )
-
-        return isinstance(exc, (RerunException, StopException))
+        control_flow_types = _streamlit_control_flow_types()
     except Exception:  # noqa: BLE001
-        # Older Streamlit versions or import failures - fail safe
+        # Older Streamlit versions or import failures - fail safe (retried next time)
         return False
+    return isinstance(exc, control_flow_types)
 
 
-def _should_passthrough(exc: BaseException) -> bool:
-    """Return True if exception should pass through without handling.
+type ErrorHook = Callable[[Exception], None]
+"""Hook that executes side effects on exceptions (audit logging, notifications, metrics, etc.)."""
 
-    Args:
-        exc: Exception to check.
+type FallbackRenderer = Callable[[Exception], None]
+"""Renderer that draws custom fallback UI when an exception occurs."""
 
-    Returns:
-        True if the exception should be re-raised without handling.
 
-    """
-    return isinstance(exc, (KeyboardInterrupt, SystemExit)) or _is_streamlit_control_flow(exc)
+def _wrap_no_hooks[**P, R](func: Callable[P, R], render: FallbackRenderer) -> Callable[P, R | None]:
+    """Build a boundary wrapper that only renders the fallback."""
 
+    def _wrapped_no_hooks(*args: P.args, **kwargs: P.kwargs) -> R | None:
+        try:
+            return func(*args, **kwargs)
+        except Exception as exc:
+            # Pass through Streamlit control flow (st.rerun(), st.stop())
+            if _is_streamlit_control_flow(exc):
+                raise
+            render(exc)
+            return None
 
-class ErrorHook(Protocol):
-    """Protocol for error hooks that execute side effects on exceptions.
+    return _wrapped_no_hooks
+
+
+def _wrap_one_hook[**P, R](
+    func: Callable[P, R],
+    hook: ErrorHook,
+    render: FallbackRenderer,
+) -> Callable[P, R | None]:
+    """Build a boundary wrapper that calls a single hook without looping."""
+
+    def _wrapped_one_hook(*args: P.args, **kwargs: P.kwargs) -> R | None:
+        try:
+            return func(*args, **kwargs)
+        except Exception as exc:
+            # Pass through Streamlit control flow (st.rerun(), st.stop())
+            if _is_streamlit_control_flow(exc):
+                raise
+            try:
+                hook(exc)
+            except Exception:  # noqa: S110, BLE001
+                # Suppress hook failures to prevent cascading errors
+                pass
+            render(exc)
+            return None
+
+    return _wrapped_one_hook
 
-    Used for audit logging, notifications, metrics collection, etc.
-    """
 
-    def __call__(self, exc: Exception, /) -> None:
-        """Handle exception with side effects."""
-        ...
+def _wrap_many_hooks[**P, R](
+    func: Callable[P, R],
+    hooks: tuple[ErrorHook, ...],
+    render: FallbackRenderer,
+) -> Callable[P, R | None]:
+    """Build a boundary wrapper that runs every hook in order."""
 
+    def _wrapped_many_hooks(*args: P.args, **kwargs: P.kwargs) -> R | None:
+        try:
+            return func(*args, **kwargs)
+        except Exception as exc:
+            # Pass through Streamlit control flow (st.rerun(), st.stop())
+            if _is_streamlit_control_flow(exc):
+                raise
+            # Execute all hooks, suppressing their exceptions.
+            # try/except is zero-cost when no hook raises; a shared contextlib.suppress
+            # would add __enter__/__exit__ calls per hook instead.
+            for hook in hooks:
+                try:
+                    hook(exc)
+                except Exception:  # noqa: S110, BLE001
+                    # Suppress hook failures to prevent cascading errors
+                    pass
+            render(exc)
+            return None
+
+    return _wrapped_many_hooks
+
+
+def _copy_metadata(wrapper: Callable[..., object], source: Callable[..., object]) -> None:
+    """Copy the metadata callers rely on from source onto wrapper.
+
+    Avoids update_wrapper's generic attribute loop and __dict__ update. getattr
+    defaults keep callables without __name__ (e.g. functools.partial callbacks) working.
+    """
+    function = cast("FunctionType", wrapper)
+    function.__module__ = getattr(source, "__module__", function.__module__)
+    function.__name__ = getattr(source, "__name__", function.__name__)
+    function.__qualname__ = getattr(source, "__qualname__", function.__qualname__)
+    function.__doc__ = getattr(source, "__doc__", None)
+    function.__annotations__ = getattr(source, "__annotations__", function.__annotations__)
+    function.__type_params__ = getattr(source, "__type_params__", function.__type_params__)
+    setattr(function, "__wrapped__", source)  # noqa: B010
+
+
+def _build_wrapper[**P, R](
+    func: Callable[P, R],
+    hooks: tuple[ErrorHook, ...],
+    render: FallbackRenderer,
+    wrapped: Callable[P, R] | None = None,
+) -> Callable[P, R | None]:
+    """Build the error-boundary wrapper shared by decorated functions and callbacks.
+
+    Hook execution and fallback rendering are inlined into the wrapper so a
+    handled exception does not enter any extra Python frame. The wrapper is
+    specialized for zero, one, or many hooks so the common single-hook case
+    does not pay for the hook loop.
+
+    Only Exception subclasses are handled; BaseExceptions such as KeyboardInterrupt,
+    SystemExit, and GeneratorExit propagate without touching hooks or fallback.
+
+    Args:
+        func: Function or widget callback to wrap with error handling.
+        hooks: Validated hooks, executed in order.
+        render: Fallback renderer resolved at construction time.
+        wrapped: Callable whose metadata the wrapper takes on. Defaults to func.
 
-class FallbackRenderer(Protocol):
-    """Protocol for custom fallback UI renderers.
+    Returns:
+        Wrapped function that returns the original result on success,
+        or None when an exception occurs.
 
-    Allows rendering custom UI layouts when an exception occurs.
     """
+    if not hooks:
+        wrapper = _wrap_no_hooks(func, render)
+    elif len(hooks) == 1:
+        wrapper = _wrap_one_hook(func, hooks[0], render)
+    else:
+        wrapper = _wrap_many_hooks(func, hooks, render)
 
-    def __call__(self, exc: Exception, /) -> None:
-        """Render fallback UI for the exception."""
-        ...
+    _copy_metadata(wrapper, func if wrapped is None else wrapped)
+    return wrapper
 
 
 class ErrorBoundary:
@@ -95,6 +208,8 @@ class ErrorBoundary:
 
     """
 
+    __slots__ = ("__weakref__", "_cache", "_hooks", "_render")
+
     def __init__(
         self,
         on_error: ErrorHook | Iterable[ErrorHook],
@@ -112,38 +227,54 @@ class ErrorBoundary:
 
         """
         self._hooks = self._normalize_hooks(on_error)
-        self._fallback = self._normalize_fallback(fallback)
+        self._render = self._normalize_fallback(fallback)
+        # Wrappers keyed by id() of the original callable and of the wrapper itself.
+        # Each wrapper keeps its original alive, so an entry never outlives the
+        # object whose id it holds.
+        self._cache: WeakValueDictionary[int, Callable[..., object]] = WeakValueDictionary()
 
     @staticmethod
-    def _normalize_hooks(on_error: object) -> Sequence[ErrorHook]:
-        """Normalize hook input into a validated sequence."""
-        if isinstance(on_error, (str, bytes)):
+    def _normalize_hooks(on_error: object) -> tuple[ErrorHook, ...]:
+        """Normalize hook input into a validated tuple."""
+        # Fast path: concrete list/tuple skips the callable() and Iterable ABC checks.
+        # Hooks are materialized into a tuple in a single pass; a caller-supplied tuple
+        # is reused as-is so boundaries built from a shared configuration share it.
+        if isinstance(on_error, tuple):
+            hooks = cast("tuple[object, ...]", on_error)
+        elif isinstance(on_error, list):
+            hooks = tuple(cast("list[object]", on_error))
+        elif isinstance(on_error, (str, bytes)):
             msg = "on_error must be a hook or an iterable of hooks; str/bytes are not accepted."
             raise TypeError(msg)
-
-        if callable(on_error):
+        elif callable(on_error):
             return (cast("ErrorHook", on_error),)
-
-        if not isinstance(on_error, Iterable):
+        elif isinstance(on_error, Iterable):
+            hooks = tuple(cast("Iterable[object]", on_error))
+        else:
             msg = "on_error must be callable or an iterable of callables."
             raise TypeError(msg)
 
-        iterable_hooks = cast("Iterable[object]", on_error)
-
-        validated: list[ErrorHook] = []
-        for index, hook in enumerate(iterable_hooks):
+        for index, hook in enumerate(hooks):
             if not callable(hook):
                 msg = f"on_error[{index}] is not callable: {hook!r}"
                 raise TypeError(msg)
-            validated.append(cast("ErrorHook", hook))
 
-        return tuple(validated)
+        return cast("tuple[ErrorHook, ...]", hooks)
 
     @staticmethod
-    def _normalize_fallback(fallback: object) -> str | FallbackRenderer:
-        """Normalize fallback into a validated handler."""
+    def _normalize_fallback(fallback: object) -> FallbackRenderer:
+        """Normalize fallback into a renderer resolved once at construction time."""
         if isinstance(fallback, str):
-            return fallback
+            # Deferred so importing the package does not pull in Streamlit until
+            # a string fallback is actually configured
+            from .plugins import render_string_fallback  # noqa: PLC0415
+
+            message = fallback
+
+            def _render_message(_: Exception) -> None:
+                render_string_fallback(message)
+
+            return _render_message
 
         if callable(fallback):
             return cast("FallbackRenderer", fallback)
@@ -151,30 +282,29 @@ class ErrorBoundary:
         msg = "fallback must be either a string or a callable (FallbackRenderer)."
         raise TypeError(msg)
 
-    def _handle_error(self, exc: Exception) -> None:
-        """Execute hooks and render fallback UI for an exception.
-
-        Args:
-            exc: The exception to handle.
+    def _wrap[**P, R](self, func: Callable[P, R]) -> Callable[P, R | None]:
+        """Return the memoized wrapper for func, building it on first use.
 
+        Passing a wrapper this boundary already produced returns it unchanged,
+        so accidental double decoration does not add a redundant frame.
         """
-        # Execute all hooks, suppressing their exceptions
-        for hook in self._hooks:
-            try:
-                hook(exc)
-            except Exception:  # noqa: S110, BLE001
-                # Suppress hook failures to prevent cascading errors
-                pass
+        key = id(func)
+        cached = self._cache.get(key)
+        if cached is not None:
+            return cast("Callable[P, R | None]", cached)
 
-        # Render fallback UI
-        if callable(self._fallback):
-            self._fallback(exc)
-        else:
-            render_string_fallback(self._fallback)
+        wrapper = _build_wrapper(func, self._hooks, self._render)
+        self._cache[key] = wrapper
+        self._cache[id(wrapper)] = wrapper
+        return wrapper
 
     def decorate[**P, R](self, func: Callable[P, R]) -> Callable[P, R | None]:
         """Wrap a function with error boundary.
 
+        Wrappers are memoized per boundary: wrapping the same function again returns
+        the same shared wrapper, and passing a wrapper this boundary produced returns
+        it unchanged, so attributes set on the result are visible to every caller.
+
         Args:
             func: Function to wrap with error handling.
 
@@ -183,30 +313,77 @@ class ErrorBoundary:
             or None when an exception occurs.
 
         """
+        return self._wrap(func)
 
-        @wraps(func)
-        def _wrapped(*args: P.args, **kwargs: P.kwargs) -> R | None:
-            try:
-                return func(*args, **kwargs)
-            except BaseException as exc:
-                # Pass through control flow exceptions
-                if _should_passthrough(exc):
-                    raise
-                # Handle normal exceptions only
-                if isinstance(exc, Exception):
-                    self._handle_error(exc)
-                    return None
-                # Unknown BaseException - re-raise for safety
-                raise
+    def decorate_cached[**P, R](
+        self,
+        key_fn: Callable[P, Hashable],
+        maxsize: int | None = 128,
+    ) -> Callable[[Callable[P, R]], Callable[P, R | None]]:
+        """Wrap a pure function with error boundary and an LRU cache of its results.
+
+        Results are cached under ``key_fn(*args, **kwargs)``. On a cache hit the
+        function body is skipped; on a miss it runs inside the boundary and its
+        result is stored only if it returns successfully. Only return values are
+        cached: Streamlit elements drawn by the function are not replayed on a hit,
+        so use this for deterministic computations rather than page rendering.
+
+        Args:
+            key_fn: Computes a hashable cache key from the call arguments.
+            maxsize: Maximum number of cached results; least recently used are evicted.
+                0 disables caching and None leaves the cache unbounded.
+
+        Returns:
+            Decorator returning a wrapped function that returns the original (or cached)
+            result on success, or None when an exception occurs.
 
-        return _wrapped
+        Raises:
+            ValueError: If maxsize is negative.
+
+        Example:
+            >>> @boundary.decorate_cached(key_fn=lambda user_id: user_id)
+            ... def load_profile(user_id: str) -> Profile:
+            ...     return fetch_profile(user_id)
+
+        """
+        if maxsize is not None and maxsize < 0:
+            msg = f"maxsize must be a non-negative integer or None, got {maxsize!r}."
+            raise ValueError(msg)
+
+        def _decorator(func: Callable[P, R]) -> Callable[P, R | None]:
+            results: OrderedDict[Hashable, R] = OrderedDict()
+            lock = Lock()
+
+            def _cached_call(*args: P.args, **kwargs: P.kwargs) -> R:
+                key = key_fn(*args, **kwargs)
+                with lock:
+                    if key in results:
+                        results.move_to_end(key)
+                        return results[key]
+
+                result = func(*args, **kwargs)
+                with lock:
+                    results[key] = result
+                    results.move_to_end(key)
+                    if maxsize is not None and len(results) > maxsize:
+                        results.popitem(last=False)
+                return result
+
+            wrapper = _build_wrapper(_cached_call, self._hooks, self._render, wrapped=func)
+            # Register like _wrap does so re-wrapping with this boundary is a no-op
+            self._cache[id(wrapper)] = wrapper
+            return wrapper
+
+        return _decorator
 
     def wrap_callback[**P, R](self, callback: Callable[P, R]) -> Callable[P, R | None]:
         """Wrap a widget callback with error boundary.
 
         This method is designed for Streamlit widget callbacks (on_click, on_change, etc.).
         Returns the original callback's return value on success, or None if an exception
-        was caught.
+        was caught. Wrappers are memoized per boundary: wrapping the same callback again
+        returns the same shared wrapper, and passing a wrapper this boundary produced
+        returns it unchanged, so attributes set on the result are visible to every caller.
 
         Args:
             callback: Widget callback to wrap with error handling.
@@ -216,23 +393,7 @@ class ErrorBoundary:
             or None when an exception occurs.
 
         """
-
-        @wraps(callback)
-        def _wrapped(*args: P.args, **kwargs: P.kwargs) -> R | None:
-            try:
-                return callback(*args, **kwargs)  # Return original value
-            except BaseException as exc:
-                # Pass through control flow exceptions
-                if _should_passthrough(exc):
-                    raise
-                # Handle normal exceptions only
-                if isinstance(exc, Exception):
-                    self._handle_error(exc)
-                    return None  # Only None on exception
-                # Unknown BaseException - re-raise for safety
-                raise
-
-        return _wrapped
+        return self._wrap(callback)
 
 
 def error_boundary[**P, R](
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import gc
+import inspect
 import sys
+import weakref
+from functools import partial
+from typing import get_type_hints
 from unittest.mock import Mock
 
 import pytest
@@ -13,6 +18,13 @@ def test_error_boundary_class_exists() -> None:
     assert ErrorBoundary is not None
 
 
+def test_error_boundary_supports_weakref() -> None:
+    """Test that ErrorBoundary instances can be weak-referenced."""
+    boundary = ErrorBoundary(on_error=lambda _: None, fallback="error")
+    ref = weakref.ref(boundary)
+    assert ref() is boundary
+
+
 def test_single_hook_is_called() -> None:
     """Test that a single error hook is executed when exception occurs."""
     called: list[str] = []
@@ -55,11 +67,28 @@ def test_multiple_hooks_executed_in_order() -> None:
     assert execution_order == ["hook1", "hook2", "hook3"]
 
 
+def test_hooks_and_fallback_receive_original_exception() -> None:
+    """Test that hooks and fallback receive the raised exception object itself."""
+    raised = RuntimeError("error")
+    received: list[Exception] = []
+
+    boundary = ErrorBoundary(on_error=[received.append, received.append], fallback=received.append)
+
+    @boundary.decorate
+    def boom() -> None:
+        raise raised
+
+    boom()
+    assert received == [raised, raised, raised]
+    assert all(exc is raised for exc in received)
+
+
 def test_string_fallback_renders(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that string fallback is rendered via render_string_fallback."""
     mock_render = Mock()
-    # Patch at the module level where render_string_fallback is imported
-    monkeypatch.setattr(sys.modules["st_error_boundary.error_boundary"], "render_string_fallback", mock_render)
+    # Patch in the plugins module, where render_string_fallback is lazily imported from.
+    # The renderer is bound when the boundary is constructed, so patch beforehand.
+    monkeypatch.setattr("st_error_boundary.plugins.render_string_fallback", mock_render)
 
     boundary = ErrorBoundary(on_error=lambda _: None, fallback="Error message")
 
@@ -150,6 +179,28 @@ def test_hook_failure_suppressed() -> None:
     assert hooks_executed == ["failing", "success"]
 
 
+def test_single_hook_failure_suppressed() -> None:
+    """Test that a failing single hook doesn't prevent the fallback from rendering."""
+    fallback_called: list[bool] = []
+
+    def failing_hook(_: Exception) -> None:
+        msg = "hook failed"
+        raise RuntimeError(msg)
+
+    def custom_fallback(_: Exception) -> None:
+        fallback_called.append(True)
+
+    boundary = ErrorBoundary(on_error=failing_hook, fallback=custom_fallback)
+
+    @boundary.decorate
+    def boom() -> None:
+        msg = "error"
+        raise RuntimeError(msg)
+
+    assert boom() is None
+    assert fallback_called == [True]
+
+
 def test_normal_return_value_preserved() -> None:
     """Test that normal execution returns the original value."""
     boundary = ErrorBoundary(on_error=lambda _: None, fallback="error")
@@ -176,15 +227,21 @@ def test_exception_returns_none() -> None:
 
 
 def test_function_metadata_preserved() -> None:
-    """Test that @wraps preserves function metadata."""
+    """Test that decorate preserves function metadata."""
     boundary = ErrorBoundary(on_error=lambda _: None, fallback="error")
 
-    @boundary.decorate
-    def my_function() -> None:
+    def my_function(x: int) -> str:
         """My docstring."""
+        return str(x)
 
-    assert my_function.__name__ == "my_function"
-    assert my_function.__doc__ == "My docstring."
+    wrapped = boundary.decorate(my_function)
+
+    assert wrapped.__name__ == "my_function"
+    assert wrapped.__doc__ == "My docstring."
+    assert wrapped.__qualname__ == my_function.__qualname__
+    assert wrapped.__module__ == my_function.__module__
+    assert wrapped.__wrapped__ is my_function  # type: ignore[attr-defined]
+    assert get_type_hints(wrapped) == {"x": int, "return": str}
 
 
 def test_wrap_callback_returns_original_value() -> None:
@@ -286,7 +343,7 @@ def test_wrap_callback_executes_hooks() -> None:
 def test_wrap_callback_renders_fallback(monkeypatch: pytest.MonkeyPatch) -> None:
     """Test that wrap_callback renders fallback UI."""
     mock_render = Mock()
-    monkeypatch.setattr(sys.modules["st_error_boundary.error_boundary"], "render_string_fallback", mock_render)
+    monkeypatch.setattr("st_error_boundary.plugins.render_string_fallback", mock_render)
 
     boundary = ErrorBoundary(on_error=lambda _: None, fallback="Callback error")
 
@@ -312,6 +369,113 @@ def test_wrap_callback_preserves_metadata() -> None:
     assert wrapped.__doc__ == "Callback docstring."
 
 
+def test_wrap_callback_adds_single_frame() -> None:
+    """Test that a wrapped callback runs exactly one frame below its caller."""
+    caller_names: list[str] = []
+
+    def callback() -> None:
+        frame = inspect.currentframe()
+        assert frame is not None
+        assert frame.f_back is not None
+        assert frame.f_back.f_back is not None
+        caller_names.append(frame.f_back.f_back.f_code.co_name)
+
+    boundary = ErrorBoundary(on_error=lambda _: None, fallback="error")
+    boundary.wrap_callback(callback)()
+
+    assert caller_names == ["test_wrap_callback_adds_single_frame"]
+
+
+def test_wrap_callback_accepts_partial() -> None:
+    """Test that wrap_callback works with callables lacking __name__ (functools.partial)."""
+    received: list[str] = []
+
+    def save(name: str) -> str:
+        received.append(name)
+        return name
+
+    wrapped = ErrorBoundary(on_error=lambda _: None, fallback="error").wrap_callback(partial(save, "alice"))
+
+    assert wrapped() == "alice"
+    assert received == ["alice"]
+    assert wrapped.__wrapped__.func is save  # type: ignore[attr-defined]
+
+
+def test_wrap_callback_reuses_wrapper_for_same_callable() -> None:
+    """Test that wrapping the same callable twice returns the cached wrapper."""
+    boundary = ErrorBoundary(on_error=lambda _: None, fallback="error")
+
+    def callback() -> None:
+        pass
+
+    def other_callback() -> None:
+        pass
+
+    wrapped = boundary.wrap_callback(callback)
+    assert boundary.wrap_callback(callback) is wrapped
+    assert boundary.decorate(callback) is wrapped
+    assert boundary.wrap_callback(other_callback) is not wrapped
+
+
+def test_decorate_twice_with_same_boundary_is_noop() -> None:
+    """Test that re-wrapping a wrapper from the same boundary returns it unchanged."""
+    called: list[str] = []
+    boundary = ErrorBoundary(on_error=lambda _: called.append("hook"), fallback="error")
+
+    @boundary.decorate
+    @boundary.decorate
+    def boom() -> None:
+        msg = "error"
+        raise RuntimeError(msg)
+
+    assert boundary.wrap_callback(boom) is boom
+    boom()
+    assert called == ["hook"]
+
+    def key() -> None:
+        return None
+
+    @boundary.decorate
+    @boundary.decorate_cached(key_fn=key)
+    def cached_boom() -> None:
+        msg = "error"
+        raise RuntimeError(msg)
+
+    assert boundary.decorate(cached_boom) is cached_boom
+    cached_boom()
+    assert called == ["hook", "hook"]
+
+
+def test_decorate_with_different_boundary_still_wraps() -> None:
+    """Test that a wrapper from another boundary is wrapped again (nesting is preserved)."""
+    inner = ErrorBoundary(on_error=lambda _: None, fallback="inner")
+    outer = ErrorBoundary(on_error=lambda _: None, fallback="outer")
+
+    def func() -> None:
+        pass
+
+    inner_wrapped = inner.decorate(func)
+    outer_wrapped = outer.decorate(inner_wrapped)
+
+    assert outer_wrapped is not inner_wrapped
+    assert outer_wrapped.__wrapped__ is inner_wrapped  # type: ignore[attr-defined]
+
+
+def test_wrapper_cache_does_not_keep_wrappers_alive() -> None:
+    """Test that cached wrappers are released once no longer referenced."""
+    boundary = ErrorBoundary(on_error=lambda _: None, fallback="error")
+
+    def callback() -> None:
+        pass
+
+    wrapped = boundary.wrap_callback(callback)
+    ref = weakref.ref(wrapped)
+    del wrapped
+    gc.collect()
+
+    assert ref() is None
+
+
 # ============================================================================
 # Runtime validation tests
 # ============================================================================
@@ -386,6 +550,33 @@ def test_on_error_accepts_generator() -> None:
     assert called == ["hook1", "hook2"]
 
 
+def test_on_error_accepts_tuple() -> None:
+    """Test that a tuple of hooks is accepted and executed in order."""
+    called: list[str] = []
+
+    def hook1(_: Exception) -> None:
+        called.append("hook1")
+
+    def hook2(_: Exception) -> None:
+        called.append("hook2")
+
+    boundary = ErrorBoundary(on_error=(hook1, hook2), fallback="error")
+
+    @boundary.decorate
+    def boom() -> None:
+        msg = "error"
+        raise RuntimeError(msg)
+
+    boom()
+    assert called == ["hook1", "hook2"]
+
+
+def test_on_error_rejects_noncallable_in_tuple() -> None:
+    """Test that non-callable elements in a tuple are detected."""
+    with pytest.raises(TypeError, match=r"on_error\[0\] is not callable: 'x'"):
+        ErrorBoundary(on_error=("x",), fallback="error")  # type: ignore[arg-type]
+
+
 # ============================================================================
 # Control flow exception tests
 # ============================================================================
@@ -502,8 +693,8 @@ def test_passthrough_without_internal_import(monkeypatch: pytest.MonkeyPatch) ->
     """Test that control flow exceptions pass through even if import fails.
 
     If _is_streamlit_control_flow returns False (e.g., due to import failure),
-    control flow exceptions should still be re-raised via the "unknown BaseException"
-    path, ensuring st.rerun()/st.stop() don't break.
+    control flow exceptions still propagate because they derive from BaseException,
+    which the boundary never catches, ensuring st.rerun()/st.stop() don't break.
     """
 
     # Get the actual module object (not the function with the same name)
@@ -524,6 +715,172 @@ def test_passthrough_without_internal_import(monkeypatch: pytest.MonkeyPatch) ->
     def raise_control_flow() -> None:
         raise ControlFlowException
 
-    # Control flow exception should still be re-raised via unknown BaseException path
+    # BaseException subclasses are never caught, so control flow still propagates
     with pytest.raises(ControlFlowException):
         raise_control_flow()
+
+
+def test_control_flow_exception_deriving_from_exception_passes_through(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that control flow exceptions are re-raised even if they subclass Exception."""
+    hook_called: list[bool] = []
+
+    class ControlFlowException(Exception):  # noqa: N818
+        """Simulates a Streamlit release where control flow derives from Exception."""
+
+    eb_module = sys.modules["st_error_boundary.error_boundary"]
+    monkeypatch.setattr(eb_module, "_streamlit_control_flow_types", lambda: (ControlFlowException,))
+
+    boundary = ErrorBoundary(on_error=lambda _: hook_called.append(True), fallback="error")
+
+    @boundary.decorate
+    def raise_control_flow() -> None:
+        raise ControlFlowException
+
+    with pytest.raises(ControlFlowException):
+        raise_control_flow()
+
+    assert hook_called == []
+
+
+# ============================================================================
+# Cached decoration tests
+# ============================================================================
+
+
+def test_decorate_cached_skips_body_on_hit() -> None:
+    """Test that decorate_cached returns the cached result without calling the function."""
+    calls: list[int] = []
+    boundary = ErrorBoundary(on_error=lambda _: None, fallback="error")
+
+    def key(x: int) -> int:
+        return x
+
+    @boundary.decorate_cached(key_fn=key)
+    def describe(x: int) -> str:
+        calls.append(x)
+        return f"value={x}"
+
+    assert describe(3) == "value=3"
+    assert describe(3) == "value=3"
+    assert describe(4) == "value=4"
+    assert calls == [3, 4]
+
+
+def test_decorate_cached_does_not_cache_failures() -> None:
+    """Test that failed calls are handled by the boundary and not cached."""
+    hook_called: list[bool] = []
+    attempts: list[int] = []
+    boundary = ErrorBoundary(on_error=lambda _: hook_called.append(True), fallback=lambda _: None)
+
+    def key(x: int) -> int:
+        return x
+
+    @boundary.decorate_cached(key_fn=key)
+    def flaky(x: int) -> int:
+        attempts.append(x)
+        if len(attempts) == 1:
+            msg = "first call fails"
+            raise RuntimeError(msg)
+        return x
+
+    assert flaky(1) is None
+    assert flaky(1) == 1
+    assert flaky(1) == 1
+    assert attempts == [1, 1]
+    assert hook_called == [True]
+
+
+def test_decorate_cached_evicts_least_recently_used() -> None:
+    """Test that decorate_cached evicts the least recently used entry beyond maxsize."""
+    calls: list[str] = []
+    boundary = ErrorBoundary(on_error=lambda _: None, fallback="error")
+
+    def identity(name: str) -> str:
+        return name
+
+    @boundary.decorate_cached(key_fn=identity, maxsize=2)
+    def load(name: str) -> str:
+        calls.append(name)
+        return name
+
+    load("a")
+    load("b")
+    load("a")  # "a" becomes most recently used
+    load("c")  # evicts "b"
+    load("a")
+    load("b")
+    assert calls == ["a", "b", "c", "b"]
+
+
+def test_decorate_cached_key_fn_failure_is_handled() -> None:
+    """Test that an exception raised by key_fn is handled by the boundary."""
+    fallback_called: list[bool] = []
+    boundary = ErrorBoundary(on_error=lambda _: None, fallback=lambda _: fallback_called.append(True))
+
+    def bad_key(x: object) -> str:
+        msg = f"cannot derive key from {x!r}"
+        raise ValueError(msg)
+
+    @boundary.decorate_cached(key_fn=bad_key)
+    def compute(x: object) -> object:
+        return x
+
+    assert compute([1]) is None
+    assert fallback_called == [True]
+
+
+def test_decorate_cached_preserves_metadata() -> None:
+    """Test that decorate_cached preserves function metadata."""
+    boundary = ErrorBoundary(on_error=lambda _: None, fallback="error")
+
+    @boundary.decorate_cached(key_fn=lambda: None)
+    def my_function() -> None:
+        """My docstring."""
+
+    assert my_function.__name__ == "my_function"
+    assert my_function.__doc__ == "My docstring."
+    assert my_function.__wrapped__.__name__ == "my_function"  # type: ignore[attr-defined]
+
+
+def test_decorate_cached_unbounded_with_none() -> None:
+    """Test that maxsize=None keeps every result cached."""
+    calls: list[int] = []
+    boundary = ErrorBoundary(on_error=lambda _: None, fallback="error")
+
+    def key(x: int) -> int:
+        return x
+
+    @boundary.decorate_cached(key_fn=key, maxsize=None)
+    def load(x: int) -> int:
+        calls.append(x)
+        return x
+
+    for x in [*range(200), *range(200)]:
+        load(x)
+    assert calls == list(range(200))
+
+
+def test_decorate_cached_rejects_negative_maxsize() -> None:
+    """Test that a negative maxsize is rejected."""
+    boundary = ErrorBoundary(on_error=lambda _: None, fallback="error")
+
+    def key() -> None:
+        return None
+
+    with pytest.raises(ValueError, match="maxsize must be a non-negative integer or None"):
+        boundary.decorate_cached(key_fn=key, maxsize=-1)
+
+
+def test_control_flow_lookup_retries_after_import_failure(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a failed control-flow type import is not cached for the process lifetime."""
+    from streamlit.runtime.scriptrunner_utils.exceptions import StopException  # noqa: PLC0415
+
+    eb_module = sys.modules["st_error_boundary.error_boundary"]
+    eb_module._streamlit_control_flow_types.cache_clear()  # noqa: SLF001
+
+    with monkeypatch.context() as m:
+        # A None entry in sys.modules makes the import raise ImportError
+        m.setitem(sys.modules, "streamlit.runtime.scriptrunner_utils.exceptions", None)
+        assert eb_module._is_streamlit_control_flow(StopException()) is False  # noqa: SLF001
+
+    assert eb_module._is_streamlit_control_flow(StopException()) is True  # noqa: SLF001